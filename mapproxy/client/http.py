@@ -213,7 +213,7 @@ class HTTPClient(object):
         resp = self.open(url, data=data)
         if 'content-type' in resp.headers:
             if not resp.headers['content-type'].lower().startswith('image'):
-                raise HTTPClientError('response is not an image: (%s)' % (resp.read()))
+                raise HTTPClientError('response is not an image: (%s)' % (format_error_body(resp)))
         return ImageSource(resp)
 
     def handle_url_exception(self, url, message, reason, response_code=None):
@@ -279,6 +279,31 @@ def auth_data_from_url(url):
     return url, (username, password)
 
 
+def read_error_body(resp, max_size=4096):
+    """
+    Read at most `max_size` bytes from `resp` for error messages.
+    Avoids loading large (or endless) error responses into memory.
+
+    :returns: tuple with the decoded body and whether it was truncated
+    """
+    data = resp.read(max_size + 1)
+
+    truncated = False
+    if len(data) == max_size + 1:
+        data = data[:-1]
+        truncated = True
+
+    return data.decode('utf-8', 'backslashreplace'), truncated
+
+
+def format_error_body(resp, max_size=4096):
+    """
+    Return the start of the body of `resp` as repr for error messages.
+    """
+    body, truncated = read_error_body(resp, max_size)
+    return repr(body) + (' [output truncated]' if truncated else '')
+
+
 def open_url(url):
     url, (username, password) = auth_data_from_url(url)
     http_client = HTTPClient(url, username, password)
@@ -294,5 +319,5 @@ def retrieve_image(url, client=None):
     """
     resp = open_url(url)
     if not resp.headers['content-type'].startswith('image'):
-        raise HTTPClientError('response is not an image: (%s)' % (resp.read()))
+        raise HTTPClientError('response is not an image: (%s)' % (format_error_body(resp)))
     return ImageSource(resp)
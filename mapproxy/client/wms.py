@@ -21,7 +21,7 @@ from codecs import decode
 from mapproxy.request.base import split_mime_type
 from mapproxy.layer import InfoQuery
 from mapproxy.source import SourceError
-from mapproxy.client.http import HTTPClient
+from mapproxy.client.http import HTTPClient, read_error_body
 from mapproxy.srs import make_lin_transf, SRS, SupportedSRS
 from mapproxy.image import ImageSource
 from mapproxy.image.opts import ImageOptions
@@ -75,16 +75,10 @@ class WMSClient(object):
                 log_size = 8000  # larger xml exception
             else:
                 log_size = 100  # image?
-            data = resp.read(log_size+1)
+            data, truncated = read_error_body(resp, log_size)
 
-            truncated = ''
-            if len(data) == log_size+1:
-                data = data[:-1]
-                truncated = ' [output truncated]'
-
-            data = data.decode('utf-8', 'backslashreplace')
-
-            log.warning("no image returned from source WMS: {}, response was: '{}'{}".format(url, data, truncated))
+            log.warning("no image returned from source WMS: {}, response was: '{}'{}".format(
+                url, data, ' [output truncated]' if truncated else ''))
             raise SourceError('no image returned from source WMS: %s' % (url, ))
 
     def _query_url(self, query, format):
@@ -23,12 +23,13 @@ import optparse
 import logging
 import textwrap
 import datetime
-import xml.etree.ElementTree
 import yaml
 
 from contextlib import contextmanager
 from io import BytesIO
 
+from lxml import etree
+
 from .sources import sources
 from .layers import layers
 from .caches import caches
@@ -82,6 +83,32 @@ def file_or_stdout(name):
             yield codecs.getwriter('utf-8')(f)
 
 
+class _PrefixRecordingReader(object):
+    """
+    File-like wrapper that keeps the first `size` bytes that were read,
+    so that we can report the start of a document that failed to parse.
+    `truncated` is set once more than `size` bytes were read.
+    """
+
+    def __init__(self, fileobj, size):
+        self._fileobj = fileobj
+        self._size = size
+        self.prefix = b''
+        self.truncated = False
+
+    def read(self, n=-1):
+        data = self._fileobj.read(n)
+        missing = self._size - len(self.prefix)
+        if missing > 0:
+            self.prefix += data[:missing]
+        if len(data) > missing:
+            self.truncated = True
+        return data
+
+    def close(self):
+        self._fileobj.close()
+
+
 def config_command(args):
     parser = optparse.OptionParser("usage: %prog autoconfig [options]")
 
@@ -139,16 +166,21 @@ def config_command(args):
     gpkg = options.geopackage
     if cap_doc:
         if cap_doc.startswith(('http://', 'https://')):
-            cap_doc = download_capabilities(options.capabilities).read()
+            cap_file = download_capabilities(options.capabilities)
         else:
-            cap_doc = open(cap_doc, 'rb').read()
+            cap_file = open(cap_doc, 'rb')
 
+        # parse directly from the response/file instead of reading the
+        # whole document into memory first
+        cap_file = _PrefixRecordingReader(cap_file, size=1000)
         try:
-            cap = parse_capabilities(BytesIO(cap_doc))
-        except (xml.etree.ElementTree.ParseError, ValueError) as ex:
+            cap = parse_capabilities(cap_file)
+        except (etree.XMLSyntaxError, ValueError) as ex:
             print(ex, file=sys.stderr)
-            print(f"{cap_doc[:1000]} {'...' if len(cap_doc) > 1000 else ''}", file=sys.stderr)
+            print(f"{cap_file.prefix} {'...' if cap_file.truncated else ''}", file=sys.stderr)
             return 3
+        finally:
+            cap_file.close()
     elif gpkg:
         if os.path.isfile(gpkg):
             gpkg_dict = get_geopackage_configuration_dict(gpkg)
@@ -32,23 +32,26 @@ def _layer(layer, caches):
 
 
 def for_layer(layer, caches):
+    name = layer['name']
+    abstract = layer['abstract']
     conf = {
         'title': layer['title'],
     }
 
-    if layer['name']:
-        conf['name'] = layer['name']
+    if name:
+        conf['name'] = name
 
-        if layer['name'] + '_cache' in caches:
-            conf['sources'] = [layer['name'] + '_cache']
+        cache_name = name + '_cache'
+        if cache_name in caches:
+            conf['sources'] = [cache_name]
         else:
-            conf['sources'] = [layer['name'] + '_wms']
+            conf['sources'] = [name + '_wms']
 
     md = {}
-    if layer['abstract']:
-        md['abstract'] = layer['abstract']
+    if abstract:
+        md['abstract'] = abstract
 
     if md:
         conf['md'] = md
 
-    return layer['name'], conf
+    return name, conf
@@ -20,7 +20,7 @@ import optparse
 from io import BytesIO
 from urllib.parse import urlparse
 
-from xml import etree
+from lxml import etree
 
 from mapproxy.client.http import open_url, HTTPClientError
 from mapproxy.request.base import BaseRequest, url_decode
@@ -108,7 +108,7 @@ def parse_capabilities(fileobj, version='1.1.1'):
         log_error('%s\n%s\n%s\n%s\nNot a capabilities document: %s',
                   'Recieved document:', '-'*80, fileobj.getvalue(), '-'*80, ex.args[0])
         sys.exit(1)
-    except etree.ElementTree.ParseError as ex:
+    except etree.XMLSyntaxError as ex:
         log_error('%s\n%s\n%s\n%s\nCould not parse the document: %s',
                   'Recieved document:', '-'*80, fileobj.getvalue(), '-'*80, ex.args[0])
         sys.exit(1)
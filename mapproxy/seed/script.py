@@ -318,9 +318,9 @@ class SeedScript(object):
 
         # call mapproxy-seed again, poll status, terminate after --duration
         cmd = Popen(args=argv)
-        start = time.time()
+        deadline = time.monotonic() + options.duration
         while True:
-            if (time.time() - start) > options.duration:
+            if time.monotonic() > deadline:
                 try:
                     cmd.send_signal(signal.SIGINT)
                     # try to stop with sigint
@@ -341,7 +341,7 @@ class SeedScript(object):
                 time.sleep(1)
             except KeyboardInterrupt:
                 # force termination
-                start = 0
+                deadline = float('-inf')
 
     def interactive(self, seed_tasks, cleanup_tasks):
         selected_seed_tasks = []
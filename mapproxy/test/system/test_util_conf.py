@@ -53,6 +53,31 @@ class TestMapProxyConfCmd(object):
 
         assert "--capabilities required" in stderr.getvalue()
 
+    def test_broken_capabilities(self):
+        cap_file = self.tmp_filename("broken-cap.xml")
+        with open(cap_file, "wb") as f:
+            f.write(b"<WMT_MS_Capabilities><Service>")
+
+        with capture() as (stdout, stderr):
+            assert config_command(["mapproxy-conf", "--capabilities", cap_file]) == 3
+
+        err = stderr.getvalue()
+        assert "b'<WMT_MS_Capabilities><Service>'" in err
+        assert "..." not in err
+
+    def test_html_capabilities_truncated(self):
+        cap_file = self.tmp_filename("html-cap.xml")
+        doc = b"<html><body>" + b"x" * 2000 + b"</body></html"
+        with open(cap_file, "wb") as f:
+            f.write(doc)
+
+        with capture() as (stdout, stderr):
+            assert config_command(["mapproxy-conf", "--capabilities", cap_file]) == 3
+
+        err = stderr.getvalue()
+        assert repr(doc[:1000]) + " ..." in err
+        assert repr(doc[:1001]) not in err
+
     def test_stdout_output(self):
         with capture(bytes=True) as (stdout, stderr):
             assert (
@@ -65,6 +65,23 @@ class TestHTTPClient(object):
         else:
             assert False, 'expected HTTPClientError'
 
+    def test_open_image_no_image_truncated(self):
+        with mock_httpd(TESTSERVER_ADDRESS, [({'path': '/service'},
+                                              {'status': '200', 'body': b'x' * 10000,
+                                               'headers': {'content-type': 'text/plain'}})]):
+            with pytest.raises(HTTPClientError) as excinfo:
+                self.client.open_image(TESTSERVER_URL + '/service')
+        msg = excinfo.value.args[0]
+        assert msg == "response is not an image: ('" + 'x' * 4096 + "' [output truncated])"
+
+    def test_open_image_no_image_escaped(self):
+        with mock_httpd(TESTSERVER_ADDRESS, [({'path': '/service'},
+                                              {'status': '200', 'body': b"it's\nbroken",
+                                               'headers': {'content-type': 'text/plain'}})]):
+            with pytest.raises(HTTPClientError) as excinfo:
+                self.client.open_image(TESTSERVER_URL + '/service')
+        assert excinfo.value.args[0] == 'response is not an image: ("it\'s\\nbroken")'
+
     def test_invalid_url_type(self):
         try:
             self.client.open('htp://example.org')
@@ -1,9 +1,10 @@
 from __future__ import print_function
 import math
+import sys
 
 from .util import resolve_ns
 
-from xml.etree import ElementTree as etree
+from lxml import etree
 from mapproxy.request.wms import switch_bbox_epsg_axis_order
 
 
@@ -18,9 +19,16 @@ class WMSCapabilities(object):
     def __init__(self, tree):
         self.tree = tree
         self._layer_tree = None
+        self._resolved_xpaths = {}
+        self._getmap_url = None
 
     def resolve_ns(self, xpath):
-        return resolve_ns(xpath, self._namespaces, self._default_namespace)
+        # the same few xpaths are resolved for each layer, cache the results
+        resolved = self._resolved_xpaths.get(xpath)
+        if resolved is None:
+            resolved = resolve_ns(xpath, self._namespaces, self._default_namespace)
+            self._resolved_xpaths[xpath] = resolved
+        return resolved
 
     def findtext(self, tree, xpath):
         return tree.findtext(self.resolve_ns(xpath))
@@ -35,24 +43,28 @@ class WMSCapabilities(object):
         return elem.attrib[self.resolve_ns(name)]
 
     def metadata(self):
+        # look up the Service element once, all metadata is relative to it
+        service_elem = self.find(self.tree, 'Service')
+        if service_elem is None:
+            service_elem = etree.Element('Service')
         md = dict(
-            name=self.findtext(self.tree, 'Service/Name'),
-            title=self.findtext(self.tree, 'Service/Title'),
-            abstract=self.findtext(self.tree, 'Service/Abstract'),
-            fees=self.findtext(self.tree, 'Service/Fees'),
-            access_constraints=self.findtext(self.tree, 'Service/AccessConstraints'),
+            name=self.findtext(service_elem, 'Name'),
+            title=self.findtext(service_elem, 'Title'),
+            abstract=self.findtext(service_elem, 'Abstract'),
+            fees=self.findtext(service_elem, 'Fees'),
+            access_constraints=self.findtext(service_elem, 'AccessConstraints'),
         )
-        elem = self.find(self.tree, 'Service/OnlineResource')
+        elem = self.find(service_elem, 'OnlineResource')
         if elem is not None:
             md['online_resource'] = self.attrib(elem, 'xlink:href')
 
-        md['contact'] = self.parse_contact()
+        md['contact'] = self.parse_contact(service_elem)
         return md
 
-    def parse_contact(self):
-        elem = self.find(self.tree, 'Service/ContactInformation')
+    def parse_contact(self, service_elem):
+        elem = self.find(service_elem, 'ContactInformation')
         if elem is None or len(elem) == 0:
-            elem = etree.Element(None)
+            elem = etree.Element('ContactInformation')
         md = dict(
             person=self.findtext(elem, 'ContactPersonPrimary/ContactPerson'),
             organization=self.findtext(elem, 'ContactPersonPrimary/ContactOrganization'),
@@ -120,7 +132,10 @@ class WMSCapabilities(object):
         layer['res_hint'] = self.layer_res_hint(elem, parent_layer)
         layer['llbbox'] = self.layer_llbbox(elem, parent_layer)
         layer['bbox_srs'] = self.layer_bbox_srs(elem, parent_layer)
-        layer['url'] = self.requests()['GetMap']
+        if self._getmap_url is None:
+            # same for all layers, only look it up once
+            self._getmap_url = self.requests()['GetMap']
+        layer['url'] = self._getmap_url
         layer['legend'] = self.layer_legend(elem)
 
         return layer
@@ -180,6 +195,8 @@ class WMS111Capabilities(WMSCapabilities):
         return llbbox
 
     def layer_srs(self, elem, parent_layer=None):
+        # SRS codes are repeated for most layers, intern them to share one
+        # string object per code
         srs_elements = self.findall(elem, 'SRS')
         srs_codes = set()
 
@@ -187,9 +204,9 @@ class WMS111Capabilities(WMSCapabilities):
             srs = srs.text.strip().upper()
             if ' ' in srs:
                 # handle multiple codes in one SRS tag (WMS 1.1.1 7.1.4.5.5)
-                srs_codes.update(srs.split())
+                srs_codes.update(sys.intern(code) for code in srs.split())
             else:
-                srs_codes.add(srs)
+                srs_codes.add(sys.intern(srs))
 
         # unique srs-codes in either srs or parent_layer['srs']
         inherited_srs = parent_layer.get('srs', set()) if parent_layer else set()
@@ -242,7 +259,7 @@ class WMS130Capabilities(WMSCapabilities):
 
     def layer_srs(self, elem, parent_layer=None):
         srs_elements = self.findall(elem, 'CRS')
-        srs_codes = set([srs.text.strip().upper() for srs in srs_elements])
+        srs_codes = set([sys.intern(srs.text.strip().upper()) for srs in srs_elements])
         # unique srs-codes in either srs or parent_layer['srs']
         inherited_srs = parent_layer.get('srs', set()) if parent_layer else set()
         return srs_codes | inherited_srs
@@ -287,9 +304,12 @@ def yaml_sources(cap):
 
 
 def parse_capabilities(fileobj):
-    if isinstance(fileobj, str):
-        fileobj = open(fileobj, 'rb')
-    tree = etree.parse(fileobj)
+    # fileobj can be a filename or a file-like object, lxml reads both
+    # incrementally; no need to open the file or read the document upfront
+
+    # parsers are not thread-safe in lxml, create a new one for each document
+    parser = etree.XMLParser(resolve_entities=False)
+    tree = etree.parse(fileobj, parser)
     root_tag = tree.getroot().tag
     if root_tag == 'WMT_MS_Capabilities':
         return WMS111Capabilities(tree)
@@ -302,6 +322,5 @@ def parse_capabilities(fileobj):
 
 
 if __name__ == '__main__':
-    import sys
     cap = parse_capabilities(sys.argv[1])
     yaml_sources(cap)
@@ -1,5 +1,7 @@
 import os
 
+import pytest
+
 from ..parse import parse_capabilities
 
 
@@ -7,10 +9,27 @@ def local_filename(filename):
     return os.path.join(os.path.dirname(__file__), filename)
 
 
+@pytest.fixture(scope="module")
+def capabilities():
+    """
+    Returns a function that parses a capabilities document from the
+    test directory. Each document is only parsed once per module, the
+    tests must not modify the result.
+    """
+    parsed = {}
+
+    def parse(name):
+        if name not in parsed:
+            parsed[name] = parse_capabilities(local_filename(name))
+        return parsed[name]
+
+    return parse
+
+
 class TestWMS111(object):
 
-    def test_parse_metadata(self):
-        cap = parse_capabilities(local_filename("wms-example-111.xml"))
+    def test_parse_metadata(self, capabilities):
+        cap = capabilities("wms-example-111.xml")
         md = cap.metadata()
         assert md["name"] == "OGC:WMS"
         assert md["title"] == "ACME OpenStreetMap WMS"
@@ -30,8 +49,8 @@ class TestWMS111(object):
         assert md["contact"]["fax"] == "0123456789"
         assert md["contact"]["email"] == "info@example.org"
 
-    def test_parse_layer(self):
-        cap = parse_capabilities(local_filename("wms-example-111.xml"))
+    def test_parse_layer(self, capabilities):
+        cap = capabilities("wms-example-111.xml")
         lyrs = cap.layers_list()
         assert len(lyrs) == 2
         assert lyrs[0]["llbbox"] == [-180.0, -85.0511287798, 180.0, 85.0511287798]
@@ -45,8 +64,8 @@ class TestWMS111(object):
             85.0511287798,
         ]
 
-    def test_parse_layer_2(self):
-        cap = parse_capabilities(local_filename("wms-large-111.xml"))
+    def test_parse_layer_2(self, capabilities):
+        cap = capabilities("wms-large-111.xml")
         lyrs = cap.layers_list()
         assert len(lyrs) == 46
         assert lyrs[0]["llbbox"] == [-10.4, 35.7, 43.0, 74.1]
@@ -63,8 +82,8 @@ class TestWMS111(object):
 
 class TestWMS130(object):
 
-    def test_parse_metadata(self):
-        cap = parse_capabilities(local_filename("wms-example-130.xml"))
+    def test_parse_metadata(self, capabilities):
+        cap = capabilities("wms-example-130.xml")
         md = cap.metadata()
         assert md["name"] == "WMS"
         assert md["title"] == "ACME OpenStreetMap WMS"
@@ -72,8 +91,8 @@ class TestWMS130(object):
         req = cap.requests()
         assert req["GetMap"] == "http://example.org/service"
 
-    def test_parse_layer(self):
-        cap = parse_capabilities(local_filename("wms-example-130.xml"))
+    def test_parse_layer(self, capabilities):
+        cap = capabilities("wms-example-130.xml")
         lyrs = cap.layers_list()
         assert len(lyrs) == 2
         assert lyrs[0]["llbbox"] == [-180.0, -85.0511287798, 180.0, 85.0511287798]
@@ -98,14 +117,14 @@ class TestWMS130(object):
 
 class TestLargeWMSCapabilities(object):
 
-    def test_parse_metadata(self):
-        cap = parse_capabilities(local_filename("wms_nasa_cap.xml"))
+    def test_parse_metadata(self, capabilities):
+        cap = capabilities("wms_nasa_cap.xml")
         md = cap.metadata()
         assert md["name"] == "OGC:WMS"
         assert md["title"] == "JPL Global Imagery Service"
 
-    def test_parse_layer(self):
-        cap = parse_capabilities(local_filename("wms_nasa_cap.xml"))
+    def test_parse_layer(self, capabilities):
+        cap = capabilities("wms_nasa_cap.xml")
         lyrs = cap.layers_list()
         assert len(lyrs) == 15
         assert len(lyrs[0]["bbox_srs"]) == 0